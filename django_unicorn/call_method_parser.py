@@ -89,6 +89,22 @@ def eval_value(value):
     return value
 
 
+def _eval_node(node: ast.expr) -> Any:
+    """
+    Evaluates a newly parsed AST node.
+
+    Constant nodes (i.e. strings, numbers, booleans, `None`) return their value directly instead
+    of being walked by `literal_eval` in `eval_value` (whose cache never hits for a new node).
+    Python 3.7 parses these into `ast.Str`/`ast.Num` instead of `ast.Constant`, so there they still
+    go through `eval_value`.
+    """
+
+    if isinstance(node, ast.Constant):
+        return node.value
+
+    return eval_value(node)
+
+
 @lru_cache(maxsize=128, typed=True)
 def parse_kwarg(kwarg: str, raise_if_unparseable=False) -> Dict[str, Any]:
     """
@@ -115,7 +131,7 @@ def parse_kwarg(kwarg: str, raise_if_unparseable=False) -> Dict[str, Any]:
                 target = assign.targets[0]
                 key = _get_expr_string(target)
 
-                return {key: eval_value(assign.value)}
+                return {key: _eval_node(assign.value)}
             except ValueError:
                 if raise_if_unparseable:
                     raise
@@ -130,7 +146,7 @@ def parse_kwarg(kwarg: str, raise_if_unparseable=False) -> Dict[str, Any]:
         raise InvalidKwarg(f"'{kwarg}' could not be parsed")
 
 
-@lru_cache(maxsize=128, typed=True)
+@lru_cache(maxsize=2048, typed=True)
 def parse_call_method_name(
     call_method_name: str,
 ) -> Tuple[str, Tuple[Any], Mapping[str, Any]]:
@@ -161,8 +177,8 @@ def parse_call_method_name(
     if tree.body and isinstance(statement, ast.Call):
         call = tree.body[0].value
         method_name = call.func.id
-        args = [eval_value(arg) for arg in call.args]
-        kwargs = {kw.arg: eval_value(kw.value) for kw in call.keywords}
+        args = [_eval_node(arg) for arg in call.args]
+        kwargs = {kw.arg: _eval_node(kw.value) for kw in call.keywords}
 
     # Add "$" back to special functions
     if is_special_method:
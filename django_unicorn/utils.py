@@ -2,6 +2,7 @@ import collections.abc
 import hmac
 import logging
 import pickle
+from functools import lru_cache
 from inspect import signature
 from pprint import pprint
 from typing import Dict, List, Union
@@ -28,6 +29,23 @@ logger = logging.getLogger(__name__)
 type_hints_cache = LRUCache(maxsize=100)
 function_signature_cache = LRUCache(maxsize=100)
 
+# Checksums are `_CHECKSUM_LENGTH` characters of the `shortuuid` base57 alphabet encoded from the
+# first `_CHECKSUM_DIGEST_BYTES` of the HMAC digest. 2^64 is ~166,000 times 57^8, so folding the
+# digest onto the possible checksums keeps them uniformly distributed (bias < 0.001%)
+_CHECKSUM_ALPHABET = shortuuid.get_alphabet()
+_CHECKSUM_LENGTH = 8
+_CHECKSUM_DIGEST_BYTES = 8
+
+
+@lru_cache(maxsize=8)
+def _get_hmac_prototype(secret_key: str) -> hmac.HMAC:
+    """
+    Gets an `HMAC` that is already initialized with the secret key. Keyed on the secret key so
+    that changes to `settings.SECRET_KEY` are respected.
+    """
+
+    return hmac.new(str.encode(secret_key), digestmod="sha256")
+
 
 def generate_checksum(data: Union[str, bytes]) -> str:
     """
@@ -39,12 +57,18 @@ def generate_checksum(data: Union[str, bytes]) -> str:
     else:
         data_bytes = data
 
-    checksum = hmac.new(
-        str.encode(settings.SECRET_KEY),
-        data_bytes,
-        digestmod="sha256",
-    ).hexdigest()
-    checksum = shortuuid.uuid(checksum)[:8]
+    # Copy the prototype to skip re-deriving the inner and outer keys for every checksum
+    checksum_hmac = _get_hmac_prototype(settings.SECRET_KEY).copy()
+    checksum_hmac.update(data_bytes)
+
+    # Encode the binary digest directly instead of hex-encoding it and then hashing it again
+    # into a UUID with `shortuuid.uuid`
+    number = int.from_bytes(checksum_hmac.digest()[:_CHECKSUM_DIGEST_BYTES], "big")
+    checksum = ""
+
+    for _ in range(_CHECKSUM_LENGTH):
+        (number, digit) = divmod(number, len(_CHECKSUM_ALPHABET))
+        checksum += _CHECKSUM_ALPHABET[digit]
 
     return checksum
 
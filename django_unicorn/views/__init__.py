@@ -4,8 +4,8 @@ from functools import wraps
 from typing import Dict, Sequence
 
 from django.core.cache import caches
-from django.forms import ValidationError
-from django.http import HttpRequest, JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, HttpResponse
 from django.http.response import HttpResponseNotModified
 from django.utils.safestring import mark_safe
 from django.views.decorators.csrf import csrf_protect
@@ -27,12 +27,52 @@ from django_unicorn.settings import (
 from django_unicorn.utils import CacheableComponent, generate_checksum
 from django_unicorn.views.action_parsers import call_method, sync_input
 from django_unicorn.views.objects import ComponentRequest
-from django_unicorn.views.utils import set_property_from_data
+from django_unicorn.views.utils import set_properties_from_data
 
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Map of action type in the request to the function that handles it; every handler returns
+# (component, is_refresh_called, is_reset_called, validate_all_fields, return_data)
+_ACTION_HANDLERS = {
+    "syncInput": sync_input.handle,
+    "callMethod": call_method.handle,
+}
+
+django_json_encoder = DjangoJSONEncoder()
+
+# Serialize non-`str` dictionary keys like the stdlib `json` does and numpy types natively
+# instead of falling back to `DjangoJSONEncoder`
+_ORJSON_RESPONSE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _orjson_response(data: Dict) -> HttpResponse:
+    """
+    Returns an `HttpResponse` with `data` serialized by `orjson` instead of the stdlib `json`
+    serialization that `JsonResponse` uses. Types that `orjson` can't handle natively fall back
+    to `DjangoJSONEncoder`.
+    """
+
+    return HttpResponse(
+        orjson.dumps(
+            data,
+            default=django_json_encoder.default,
+            option=_ORJSON_RESPONSE_OPTIONS,
+        ),
+        content_type="application/json",
+    )
+
+
+def _error_response(message: str) -> HttpResponse:
+    """
+    Returns a JSON response with the error message in the `error` key.
+    """
+
+    return HttpResponse(
+        orjson.dumps({"error": message}), content_type="application/json"
+    )
+
 
 def handle_error(view_func):
     """
@@ -43,11 +83,11 @@ def handle_error(view_func):
         try:
             return view_func(*args, **kwargs)
         except UnicornViewError as e:
-            return JsonResponse({"error": str(e)})
+            return _error_response(str(e))
         except RenderNotModified:
             return HttpResponseNotModified()
         except AssertionError as e:
-            return JsonResponse({"error": str(e)})
+            return _error_response(str(e))
 
     return wraps(view_func)(wrapped_view)
 
@@ -63,7 +103,7 @@ def _process_component_request(
             - update the properties based on the payload for "syncInput"
             - call the method specified for "callMethod"
         4. validate any fields specified in a Django form
-        5. construct a `dict` that will get returned in a `JsonResponse` later on
+        5. construct a `dict` that will get returned as JSON later on
 
     Args:
         param request: HttpRequest for the function-based view.
@@ -94,8 +134,7 @@ def _process_component_request(
     original_data = copy.deepcopy(component_request.data)
 
     # Set component properties based on request data
-    for (property_name, property_value) in component_request.data.items():
-        set_property_from_data(component, property_name, property_value)
+    set_properties_from_data(component, component_request.data)
     component.hydrate()
 
     validate_all_fields = False
@@ -110,41 +149,27 @@ def _process_component_request(
         else:
             partials = action.partials
 
-        if action.action_type == "syncInput":
-            sync_input.handle(component_request, component, action.payload)
-        elif action.action_type == "callMethod":
-            try:
-                (
-                    component,
-                    _is_refresh_called,
-                    _is_reset_called,
-                    _validate_all_fields,
-                    return_data,
-                ) = call_method.handle(component_request, component, action.payload)
-
-                is_refresh_called = is_refresh_called | _is_refresh_called
-                is_reset_called = is_reset_called | _is_reset_called
-                validate_all_fields = validate_all_fields | _validate_all_fields
-            except ValidationError as e:
-                assert not hasattr(
-                    e, "error_list"
-                ), "ValidationError must be instantiated with a dictionary"
-
-                for field, message in e.message_dict.items():
-                    assert e.args[1], "Error code must be specified"
-                    error_code = e.args[1]
-
-                    if field in component.errors:
-                        component.errors[field].append(
-                            {"code": error_code, "message": message}
-                        )
-                    else:
-                        component.errors[field] = [
-                            {"code": error_code, "message": message}
-                        ]
-        else:
+        handler = _ACTION_HANDLERS.get(action.action_type)
+
+        if handler is None:
             raise UnicornViewError(f"Unknown action_type '{action.action_type}'")
 
+        (
+            component,
+            _is_refresh_called,
+            _is_reset_called,
+            _validate_all_fields,
+            _return_data,
+        ) = handler(component_request, component, action.payload)
+
+        is_refresh_called = is_refresh_called | _is_refresh_called
+        is_reset_called = is_reset_called | _is_reset_called
+        validate_all_fields = validate_all_fields | _validate_all_fields
+
+        # Keep the return data from a previous action if this one didn't return any
+        if _return_data is not None:
+            return_data = _return_data
+
     component.complete()
 
     # Re-load frontend context variables to deal with non-serializable properties
@@ -154,8 +179,10 @@ def _process_component_request(
     safe_fields = []
     if hasattr(component, "Meta") and hasattr(component.Meta, "safe"):
         if isinstance(component.Meta.safe, Sequence):
+            attributes = component._attributes()
+
             for field_name in component.Meta.safe:
-                if field_name in component._attributes().keys():
+                if field_name in attributes:
                     safe_fields.append(field_name)
 
     # Mark safe attributes as such before rendering
@@ -508,7 +535,7 @@ def _handle_queued_component_requests(
 @handle_error
 @csrf_protect
 @require_POST
-def message(request: HttpRequest, component_name: str = None) -> JsonResponse:
+def message(request: HttpRequest, component_name: str = None) -> HttpResponse:
     """
     Endpoint that instantiates the component and does the correct action
     (set an attribute or call a method) depending on the JSON payload in the body.
@@ -518,7 +545,7 @@ def message(request: HttpRequest, component_name: str = None) -> JsonResponse:
         param: component_name: Name of the component, e.g. "hello-world".
 
     Returns:
-        `JsonRequest` with the following structure in the body:
+        `HttpResponse` with the following JSON structure in the body:
         {
             "id": component_id,
             "dom": html,  // re-rendered version of the component after actions in the payload are completed
@@ -534,4 +561,4 @@ def message(request: HttpRequest, component_name: str = None) -> JsonResponse:
     component_request = ComponentRequest(request, component_name)
     json_result = _handle_component_request(request, component_request)
 
-    return JsonResponse(json_result, json_dumps_params={"separators": (",", ":")})
+    return _orjson_response(json_result)
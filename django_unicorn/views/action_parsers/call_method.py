@@ -1,6 +1,8 @@
-from typing import Any, Dict, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from django.db.models import Model
+from django.forms import ValidationError
 
 from django_unicorn.call_method_parser import (
     InvalidKwarg,
@@ -12,30 +14,52 @@ from django_unicorn.decorators import timed
 from django_unicorn.utils import get_method_arguments, get_type_hints
 from django_unicorn.views.action_parsers.utils import set_property_value
 from django_unicorn.views.objects import ComponentRequest, Return
-from django_unicorn.views.utils import set_property_from_data
+from django_unicorn.views.utils import set_properties_from_data
 
 
 def handle(component_request: ComponentRequest, component: UnicornView, payload: Dict):
+    """
+    Handles a "callMethod" action. A `ValidationError` raised by the called method gets added
+    to the component's errors.
+
+    Returns:
+        Tuple of the component (which is re-created for "$refresh" and "$reset"), whether
+        refresh was called, whether reset was called, whether all fields should be validated,
+        and the `Return` data of the method (`None` if a `ValidationError` was raised).
+    """
+
+    try:
+        return _handle(component_request, component, payload)
+    except ValidationError as e:
+        assert not hasattr(
+            e, "error_list"
+        ), "ValidationError must be instantiated with a dictionary"
+
+        for field, message in e.message_dict.items():
+            assert e.args[1], "Error code must be specified"
+            error_code = e.args[1]
+
+            if field in component.errors:
+                component.errors[field].append({"code": error_code, "message": message})
+            else:
+                component.errors[field] = [{"code": error_code, "message": message}]
+
+    return (component, False, False, False, None)
+
+
+def _handle(component_request: ComponentRequest, component: UnicornView, payload: Dict):
     call_method_name = payload.get("name", "")
     assert call_method_name, "Missing 'name' key for callMethod"
 
-    (method_name, args, kwargs) = parse_call_method_name(call_method_name)
+    (method_name, args, kwargs, setter) = _parse_call(call_method_name)
     return_data = Return(method_name, args, kwargs)
-    setter_method = {}
 
     is_refresh_called = False
     is_reset_called = False
     validate_all_fields = False
 
-    if "=" in call_method_name:
-        try:
-            setter_method = parse_kwarg(call_method_name, raise_if_unparseable=True)
-        except InvalidKwarg:
-            pass
-
-    if setter_method:
-        property_name = list(setter_method.keys())[0]
-        property_value = setter_method[property_name]
+    if setter:
+        (property_name, property_value) = setter
 
         set_property_value(component, property_name, property_value)
         return_data = Return(property_name, [property_value])
@@ -49,11 +73,7 @@ def handle(component_request: ComponentRequest, component: UnicornView, payload:
             )
 
             # Set component properties based on request data
-            for (
-                property_name,
-                property_value,
-            ) in component_request.data.items():
-                set_property_from_data(component, property_name, property_value)
+            set_properties_from_data(component, component_request.data)
             component.hydrate()
 
             is_refresh_called = True
@@ -92,6 +112,52 @@ def handle(component_request: ComponentRequest, component: UnicornView, payload:
     )
 
 
+def _parse_call(
+    call_method_name: str,
+) -> Tuple[str, Tuple[Any], Mapping[str, Any], Optional[Tuple[str, Any]]]:
+    """
+    Parses the `call_method_name` from the payload into a method call and, if it is one,
+    a setter (e.g. "name='Bob'").
+
+    Args:
+        param call_method_name: String representation of a method name with parameters or a setter.
+
+    Returns:
+        Tuple of method_name, a tuple of arguments, a mapping of keyword arguments, and a tuple of
+        the property name and value if `call_method_name` is a setter (otherwise `None`).
+    """
+
+    (method_name, args, kwargs) = parse_call_method_name(call_method_name)
+    setter = None
+
+    if "=" in call_method_name:
+        setter = _parse_setter(call_method_name)
+
+    return (method_name, args, kwargs, setter)
+
+
+@lru_cache(maxsize=128)
+def _parse_setter(call_method_name: str) -> Optional[Tuple[str, Any]]:
+    """
+    Parses a setter (e.g. "name='Bob'") into a tuple of the property name and value. Cached
+    because `parse_kwarg` raises `InvalidKwarg` for names that aren't setters, so its own
+    cache never stores those results.
+
+    Returns:
+        Tuple of the property name and value, or `None` if `call_method_name` is not a setter.
+    """
+
+    try:
+        setter_method = parse_kwarg(call_method_name, raise_if_unparseable=True)
+    except InvalidKwarg:
+        return None
+
+    if setter_method:
+        return next(iter(setter_method.items()))
+
+    return None
+
+
 @timed
 def _call_method_name(
     component: UnicornView, method_name: str, args: Tuple[Any], kwargs: Dict[str, Any]
@@ -7,6 +7,17 @@ from .utils import set_property_value
 
 
 def handle(component_request: ComponentRequest, component: UnicornView, payload: Dict):
+    """
+    Handles a "syncInput" action by setting the property from the payload on the component.
+
+    Returns:
+        The same tuple shape as the "callMethod" handler: the component, `False` for whether
+        refresh was called, reset was called, and all fields should be validated, and `None`
+        for the return data.
+    """
+
     property_name = payload.get("name")
     property_value = payload.get("value")
     set_property_value(component, property_name, property_value, component_request.data)
+
+    return (component, False, False, False, None)
@@ -1,9 +1,21 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Tuple
 
 from django.db.models import QuerySet
 
 from django_unicorn.components import UnicornView
 from django_unicorn.decorators import timed
+from django_unicorn.views.utils import _MISSING
+
+
+@lru_cache(maxsize=512)
+def _split_property_name(property_name: str) -> Tuple[str, ...]:
+    """
+    Splits a "dot-notation" property name into its parts, e.g. "author.name" becomes
+    `("author", "name")`.
+    """
+
+    return tuple(property_name.split("."))
 
 
 @timed
@@ -24,7 +36,7 @@ def set_property_value(
     assert property_name is not None, "Property name is required"
     assert property_value is not None, "Property value is required"
 
-    if not data:
+    if data is None:
         data = {}
 
     component.updating(property_name, property_value)
@@ -42,13 +54,16 @@ def set_property_value(
 
     The following code updates UnicornView.author.name based the payload's `author.name`.
     """
-    property_name_parts = property_name.split(".")
+    property_name_parts = _split_property_name(property_name)
+    last_idx = len(property_name_parts) - 1
     component_or_field = component
     data_or_dict = data  # Could be an internal portion of data that gets set
 
     for (idx, property_name_part) in enumerate(property_name_parts):
-        if hasattr(component_or_field, property_name_part):
-            if idx == len(property_name_parts) - 1:
+        attribute = getattr(component_or_field, property_name_part, _MISSING)
+
+        if attribute is not _MISSING:
+            if idx == last_idx:
                 if hasattr(component_or_field, "_set_property"):
                     # Can assume that `component_or_field` is a component
                     component_or_field._set_property(
@@ -105,22 +120,22 @@ def set_property_value(
 
                 data_or_dict[property_name_part] = property_value
             else:
-                component_or_field = getattr(component_or_field, property_name_part)
-                data_or_dict = data_or_dict.get(property_name_part, {})
+                component_or_field = attribute
+                data_or_dict = data_or_dict.setdefault(property_name_part, {})
         elif isinstance(component_or_field, dict):
-            if idx == len(property_name_parts) - 1:
+            if idx == last_idx:
                 component_or_field[property_name_part] = property_value
                 data_or_dict[property_name_part] = property_value
             else:
                 component_or_field = component_or_field[property_name_part]
-                data_or_dict = data_or_dict.get(property_name_part, {})
+                data_or_dict = data_or_dict.setdefault(property_name_part, {})
         elif isinstance(component_or_field, list) or isinstance(
             component_or_field, QuerySet
         ):
             # TODO: Check for iterable instad of list? `from collections.abc import Iterable`
             property_name_part = int(property_name_part)
 
-            if idx == len(property_name_parts) - 1:
+            if idx == last_idx:
                 component_or_field[property_name_part] = property_value
                 data_or_dict[property_name_part] = property_value
             else:
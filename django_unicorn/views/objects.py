@@ -1,3 +1,4 @@
+import hmac
 import logging
 
 from django.http.response import HttpResponseRedirect
@@ -18,9 +19,12 @@ class Action:
 
     def __init__(self, data):
         self.action_type = data.get("type")
-        self.payload = data.get("payload", {})
+
+        # Only create the empty defaults when the keys are actually missing; `data.get(key, {})`
+        # allocates the default for every action
+        self.payload = data["payload"] if "payload" in data else {}
         self.partial = data.get("partial")  # this is deprecated, but leaving it for now
-        self.partials = data.get("partials", [])
+        self.partials = data["partials"] if "partials" in data else []
 
     def __repr__(self):
         return (
@@ -50,6 +54,9 @@ class ComponentRequest:
         self.data = self.body.get("data")
         assert self.data is not None, "Missing data"  # data could theoretically be {}
 
+        # Verify the data before looking at anything else in the body
+        self.validate_checksum()
+
         self.id = self.body.get("id")
         assert self.id, "Missing component id"
 
@@ -59,8 +66,6 @@ class ComponentRequest:
         self.key = self.body.get("key", "")
         self.hash = self.body.get("hash", "")
 
-        self.validate_checksum()
-
         self.action_queue = []
 
         for action_data in self.body.get("actionQueue", []):
@@ -83,7 +88,10 @@ class ComponentRequest:
         assert checksum, "Missing checksum"
 
         generated_checksum = generate_checksum(str(self.data))
-        assert checksum == generated_checksum, "Checksum does not match"
+        # Compare bytes in constant time; `compare_digest` only accepts ASCII-only strings
+        assert hmac.compare_digest(
+            str.encode(str(checksum)), str.encode(generated_checksum)
+        ), "Checksum does not match"
 
 
 class Return:
@@ -1,6 +1,6 @@
 import logging
 from dataclasses import is_dataclass
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from django.db.models import Model, QuerySet
 
@@ -25,6 +25,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for attributes that don't exist so that `getattr` only has to be called once
+_MISSING = object()
+
 
 @timed
 def set_property_from_data(
@@ -36,30 +39,83 @@ def set_property_from_data(
     Sets properties on the component based on passed-in data.
     """
 
+    nested = _set_property_from_data(component_or_field, name, value)
+
+    if nested:
+        _set_nested_properties_from_data(*nested)
+
+
+@timed
+def set_properties_from_data(
+    component_or_field: Union[UnicornView, UnicornField, Model],
+    data: Dict,
+) -> None:
+    """
+    Sets all of the properties in `data` on the component based on passed-in data.
+    """
+
+    for (name, value) in data.items():
+        nested = _set_property_from_data(component_or_field, name, value)
+
+        if nested:
+            _set_nested_properties_from_data(*nested)
+
+
+def _set_nested_properties_from_data(
+    field: Union[UnicornField, Model],
+    data: Dict,
+) -> None:
+    """
+    Sets the nested data of a `UnicornField` or `Model`. Deeper `UnicornField` and `Model` data
+    is set depth-first (in its original order) with a stack of iterators instead of recursion.
+    """
+
+    fields = [(field, iter(data.items()))]
+
+    while fields:
+        (field, items) = fields[-1]
+
+        for (name, value) in items:
+            nested = _set_property_from_data(field, name, value)
+
+            if nested:
+                # Set the nested data before the rest of the current items
+                fields.append((nested[0], iter(nested[1].items())))
+                break
+        else:
+            fields.pop()
+
+
+def _set_property_from_data(
+    component_or_field: Union[UnicornView, UnicornField, Model],
+    name: str,
+    value: Any,
+) -> Optional[Tuple[Union[UnicornField, Model], Dict]]:
+    """
+    Sets one property on the component or field based on passed-in data.
+
+    Returns:
+        The field and its data when the property is a `UnicornField` or `Model` whose nested
+        data still needs to be set, otherwise `None`.
+    """
+
     try:
-        if not hasattr(component_or_field, name):
-            return
+        field = getattr(component_or_field, name, _MISSING)
     except ValueError:
         # Treat ValueError the same as a missing field because trying to access a many-to-many
         # field before the model's pk will throw this exception
-        return
+        return None
 
-    field = getattr(component_or_field, name)
-    component_field_is_model_or_unicorn_field = (
-        _is_component_field_model_or_unicorn_field(component_or_field, name)
-    )
+    if field is _MISSING:
+        return None
 
     # UnicornField and Models are always a dictionary (can be nested)
-    if component_field_is_model_or_unicorn_field:
+    if _is_component_field_model_or_unicorn_field(component_or_field, name):
         # Re-get the field since it might have been set in `_is_component_field_model_or_unicorn_field`
         field = getattr(component_or_field, name)
 
-        type_hints = get_type_hints(component_or_field)
-
         if isinstance(value, dict):
-            for key in value.keys():
-                key_value = value[key]
-                set_property_from_data(field, key, key_value)
+            return (field, value)
     elif hasattr(field, "related_val"):
         # Use `related_val` to check for many-to-many
         field.set(value)
@@ -91,6 +147,8 @@ def set_property_from_data(
         else:
             setattr(component_or_field, name, value)
 
+    return None
+
 
 @timed
 def _is_component_field_model_or_unicorn_field(
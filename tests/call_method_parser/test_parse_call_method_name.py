@@ -84,3 +84,12 @@ def test_special_method_with_parens():
     actual = parse_call_method_name("$reset()")
 
     assert actual == expected
+
+
+def test_constant_args_and_kwargs():
+    expected = ("f", ("x", 1, True, None), {"y": 1.5})
+    actual = parse_call_method_name("f('x', 1, True, None, y=1.5)")
+
+    assert actual == expected
+    assert isinstance(actual[1][1], int)
+    assert isinstance(actual[2]["y"], float)
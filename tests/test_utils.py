@@ -14,7 +14,7 @@ from django_unicorn.utils import (
 def test_generate_checksum_bytes(settings):
     settings.SECRET_KEY = "asdf"
 
-    expected = "TfxFqcQL"
+    expected = "9Pp6c87e"
     actual = generate_checksum(b'{"name": "test"}')
 
     assert expected == actual
@@ -23,12 +23,22 @@ def test_generate_checksum_bytes(settings):
 def test_generate_checksum_str(settings):
     settings.SECRET_KEY = "asdf"
 
-    expected = "TfxFqcQL"
+    expected = "9Pp6c87e"
     actual = generate_checksum('{"name": "test"}')
 
     assert expected == actual
 
 
+def test_generate_checksum_secret_key_changed(settings):
+    settings.SECRET_KEY = "asdf"
+    expected = generate_checksum('{"name": "test"}')
+
+    settings.SECRET_KEY = "qwer"
+    actual = generate_checksum('{"name": "test"}')
+
+    assert expected != actual
+
+
 def test_get_method_arguments():
     def test_func(input_str):
         return input_str
@@ -0,0 +1,32 @@
+from django_unicorn.views.action_parsers.call_method import _parse_call
+
+
+def test_parse_call_method():
+    (method_name, args, kwargs, setter) = _parse_call("set_name('Bob')")
+
+    assert method_name == "set_name"
+    assert args == ("Bob",)
+    assert kwargs == {}
+    assert setter is None
+
+
+def test_parse_call_setter():
+    (method_name, args, kwargs, setter) = _parse_call("name='Bob'")
+
+    assert setter == ("name", "Bob")
+
+
+def test_parse_call_method_with_equals_in_kwarg():
+    (method_name, args, kwargs, setter) = _parse_call("set_name(name='Bob')")
+
+    assert method_name == "set_name"
+    assert kwargs == {"name": "Bob"}
+    assert setter is None
+
+
+def test_parse_call_special_method():
+    (method_name, args, kwargs, setter) = _parse_call("$reset")
+
+    assert method_name == "$reset"
+    assert args == ()
+    assert setter is None
@@ -151,3 +151,15 @@ def test_set_property_value_many_to_many_references_model():
 
     assert data["taste"]["flavor"] == [flavor.pk]
     assert component.taste.flavor.count() == 1
+
+
+def test_set_property_value_nested_model_missing_from_data():
+    component = FakeComponent(component_name="test", component_id="12345678")
+    assert "initial-flavor" == component.model.name
+
+    data = {}
+
+    set_property_value(component, "model.name", "nested-flavor", data)
+
+    assert component.model.name == "nested-flavor"
+    assert data == {"model": {"name": "nested-flavor"}}
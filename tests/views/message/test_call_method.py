@@ -132,6 +132,51 @@ def test_message_call_method_return_value(client):
     assert return_data.get("value") == "booya"
 
 
+def test_message_call_method_return_value_kept_after_sync_input(client):
+    body = post_and_get_response(
+        client,
+        url="/message/tests.views.fake_components.FakeComponent",
+        data={"method_count": 0},
+        action_queue=[
+            {
+                "payload": {"name": "test_return_value"},
+                "type": "callMethod",
+            },
+            {
+                "payload": {"name": "method_count", "value": 1},
+                "type": "syncInput",
+            },
+        ],
+    )
+
+    assert body["data"].get("method_count") == 1
+    assert "return" in body
+    assert body["return"].get("method") == "test_return_value"
+    assert body["return"].get("value") == "booya"
+
+
+def test_message_call_method_return_value_kept_after_validation_error(client):
+    body = post_and_get_response(
+        client,
+        url="/message/tests.views.fake_components.FakeComponent",
+        action_queue=[
+            {
+                "payload": {"name": "test_return_value"},
+                "type": "callMethod",
+            },
+            {
+                "payload": {"name": "test_validation_error"},
+                "type": "callMethod",
+            },
+        ],
+    )
+
+    assert body["errors"]["check"][0]["code"] == "required"
+    assert "return" in body
+    assert body["return"].get("method") == "test_return_value"
+    assert body["return"].get("value") == "booya"
+
+
 def test_message_call_method_poll_update(client):
     body = _post_to_component(client, method_name="test_poll_update")
 
@@ -1,7 +1,5 @@
 import time
 
-from django.http import JsonResponse
-
 import pytest
 
 from django_unicorn.errors import ComponentClassLoadError, ComponentModuleLoadError
@@ -9,7 +7,7 @@ from django_unicorn.views import message
 
 
 def assert_json_error(response, error):
-    assert isinstance(response, JsonResponse)
+    assert response["Content-Type"] == "application/json"
     assert response.status_code == 200
     assert response.json().get("error") == error
 
@@ -66,10 +64,32 @@ def test_message_bad_checksum(client):
     assert_json_error(response, "Checksum does not match")
 
 
+def test_message_bad_checksum_checked_before_other_fields(client):
+    data = {
+        "data": {},
+        "checksum": "asdf",
+    }
+    response = post_json(client, data)
+
+    assert_json_error(response, "Checksum does not match")
+
+
+def test_message_non_ascii_checksum(client):
+    data = {
+        "data": {},
+        "checksum": "åsdf",
+        "id": "asdf",
+        "epoch": time.time(),
+    }
+    response = post_json(client, data)
+
+    assert_json_error(response, "Checksum does not match")
+
+
 def test_message_no_component_id(client):
     data = {
         "data": {},
-        "checksum": "DVVk97cx",
+        "checksum": "YeXDsAWt",
         "epoch": time.time(),
     }
     response = post_json(client, data)
@@ -78,7 +98,7 @@ def test_message_no_component_id(client):
 
 
 def test_message_no_epoch(client):
-    data = {"data": {}, "checksum": "DVVk97cx", "id": "abc"}
+    data = {"data": {}, "checksum": "YeXDsAWt", "id": "abc"}
     response = post_json(client, data)
 
     assert_json_error(response, "Missing epoch")
@@ -87,7 +107,7 @@ def test_message_no_epoch(client):
 def test_message_component_module_not_loaded(client):
     data = {
         "data": {},
-        "checksum": "DVVk97cx",
+        "checksum": "YeXDsAWt",
         "id": "asdf",
         "epoch": time.time(),
     }
@@ -105,7 +125,7 @@ def test_message_component_module_not_loaded(client):
 def test_message_component_class_not_loaded(client):
     data = {
         "data": {},
-        "checksum": "DVVk97cx",
+        "checksum": "YeXDsAWt",
         "id": "asdf",
         "epoch": time.time(),
     }
@@ -134,7 +154,7 @@ def test_message_component_class_not_loaded(client):
 def test_message_component_class_with_attribute_error(client):
     data = {
         "data": {},
-        "checksum": "DVVk97cx",
+        "checksum": "YeXDsAWt",
         "id": "asdf",
         "epoch": time.time(),
     }
@@ -152,7 +172,7 @@ def test_message_component_class_with_attribute_error(client):
 def test_message_component_with_dash(client):
     data = {
         "data": {},
-        "checksum": "DVVk97cx",
+        "checksum": "YeXDsAWt",
         "id": "asdf",
         "epoch": time.time(),
     }
@@ -169,7 +189,7 @@ def test_message_component_with_dash(client):
 def test_message_component_with_dot(client):
     data = {
         "data": {},
-        "checksum": "DVVk97cx",
+        "checksum": "YeXDsAWt",
         "id": "asdf",
         "epoch": time.time(),
     }
@@ -181,3 +201,19 @@ def test_message_component_with_dot(client):
         e.exconly()
         == "django_unicorn.errors.ComponentClassLoadError: The component class 'test.a' could not be loaded."
     )
+
+
+def test_message_response_is_json(client):
+    data = {
+        "data": {},
+        "checksum": "YeXDsAWt",
+        "id": "asdf",
+        "epoch": time.time(),
+    }
+    response = post_json(
+        client, data, url="/message/tests.views.fake_components.FakeComponent"
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response.json().get("id") == "asdf"
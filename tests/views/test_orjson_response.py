@@ -0,0 +1,48 @@
+from datetime import datetime
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy
+
+import orjson
+
+from django_unicorn.views import _error_response, _orjson_response
+
+
+def test_orjson_response():
+    response = _orjson_response({"id": "asdf", "dom": '<div class="test">\n</div>'})
+
+    assert response["Content-Type"] == "application/json"
+    assert orjson.loads(response.content) == {
+        "id": "asdf",
+        "dom": '<div class="test">\n</div>',
+    }
+
+
+def test_orjson_response_non_str_keys():
+    response = _orjson_response({"data": {1: "one"}})
+
+    assert orjson.loads(response.content) == {"data": {"1": "one"}}
+
+
+def test_orjson_response_django_json_encoder_fallback():
+    response = _orjson_response(
+        {
+            "decimal": Decimal("1.1"),
+            "lazy": gettext_lazy("lazy"),
+            "datetime": datetime(2020, 1, 1, 1, 1, 1),
+        }
+    )
+
+    assert orjson.loads(response.content) == {
+        "decimal": "1.1",
+        "lazy": "lazy",
+        "datetime": "2020-01-01T01:01:01",
+    }
+
+
+def test_error_response():
+    response = _error_response('Something "bad" happened')
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert orjson.loads(response.content) == {"error": 'Something "bad" happened'}
@@ -36,3 +36,18 @@ def test_set_property_from_data_nested_unicorn_field():
     assert (
         "nested_property_one_updated" == component.property_one.nested_property_one.name
     )
+
+
+def test_set_property_from_data_nested_unicorn_field_missing_attribute():
+    component = NestedPropertyView(component_name="test", component_id="12345678")
+
+    data = {
+        "missing": "value",
+        "nested_property_one": {"name": "nested_property_one_updated"},
+    }
+    set_property_from_data(component, "property_one", data)
+
+    assert not hasattr(component.property_one, "missing")
+    assert (
+        "nested_property_one_updated" == component.property_one.nested_property_one.name
+    )
@@ -6,7 +6,10 @@ from django.db.models import Model, QuerySet
 import pytest
 
 from django_unicorn.components import QuerySetType, UnicornView
-from django_unicorn.views.utils import set_property_from_data
+from django_unicorn.views.utils import (
+    set_properties_from_data,
+    set_property_from_data,
+)
 from example.coffee.models import Flavor
 
 
@@ -172,3 +175,22 @@ def test_set_property_from_data_many_to_many():
 
     # No `TypeError: Direct assignment to the reverse side of a many-to-many set is prohibited.` error gets raised
     set_property_from_data(component.model, "taste_set", [])
+
+
+def test_set_properties_from_data():
+    component = FakeComponent(component_name="test", component_id="12345678")
+
+    set_properties_from_data(
+        component,
+        {
+            "string": "property_view_updated",
+            "integer": 100,
+            "model": {"name": "test-test"},
+            "missing": "value",
+        },
+    )
+
+    assert component.string == "property_view_updated"
+    assert component.integer == 100
+    assert component.model.name == "test-test"
+    assert not hasattr(component, "missing")